@@ -1,18 +1,34 @@
 #!/usr/bin/env python3
 import argparse
+import copy
 import json
+import logging
 import os
+import select
 import signal
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
 
 import ctypes
 import ctypes.util
 
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
+
 NVML_SUCCESS = 0
+IDLE_TEMP_DELTA = 1.0
+IDLE_BACKOFF_STEPS = 3
+IDLE_MAX_INTERVAL = 30.0
 DEFAULT_CONFIG_PATH = "/etc/nvidia-fan-manager/config.json"
+LOG_FORMAT = "[%(name)s] %(message)s"
 DEFAULT_CURVE = [
     {"temperature": 30, "speed": 25},
     {"temperature": 40, "speed": 35},
@@ -33,10 +49,21 @@ DEFAULT_CONFIG = {
 }
 
 
+log = logging.getLogger("fan-manager")
+
+
 class NvmlError(RuntimeError):
     pass
 
 
+_PROTO_GET_HANDLE = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p))
+_PROTO_GET_TEMP = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint))
+_PROTO_GET_FAN_SPEED = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint))
+_PROTO_SET_FAN_SPEED = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint)
+_PROTO_SET_DEFAULT_FAN_SPEED = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint)
+_PROTO_GET_NUM_FANS = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint))
+
+
 def load_nvml():
     lib_path = ctypes.util.find_library("nvidia-ml")
     if not lib_path:
@@ -48,6 +75,54 @@ def load_nvml():
     return lib
 
 
+def _bind_nvml(proto, name: str, lib):
+    try:
+        return proto((name, lib))
+    except AttributeError:
+        raise NvmlError(f"{name} not available in libnvidia-ml (driver too old?)") from None
+
+
+class NvmlFunctions:
+    def __init__(self, lib):
+        self.get_handle = _bind_nvml(_PROTO_GET_HANDLE, "nvmlDeviceGetHandleByIndex_v2", lib)
+        self.get_temp = _bind_nvml(_PROTO_GET_TEMP, "nvmlDeviceGetTemperature", lib)
+        self.get_fan_speed = _bind_nvml(_PROTO_GET_FAN_SPEED, "nvmlDeviceGetFanSpeed_v2", lib)
+        self.set_fan_speed = _bind_nvml(_PROTO_SET_FAN_SPEED, "nvmlDeviceSetFanSpeed_v2", lib)
+        self.set_default_fan_speed = _bind_nvml(_PROTO_SET_DEFAULT_FAN_SPEED, "nvmlDeviceSetDefaultFanSpeed_v2", lib)
+        self.get_num_fans = None
+        if hasattr(lib, "nvmlDeviceGetNumFans"):
+            self.get_num_fans = _PROTO_GET_NUM_FANS(("nvmlDeviceGetNumFans", lib))
+
+
+_NVML_LIB = None
+_NVML_FUNCS: Optional[NvmlFunctions] = None
+_nvml_refcount = 0
+_nvml_lock = threading.Lock()
+
+
+def acquire_nvml():
+    global _NVML_LIB, _NVML_FUNCS, _nvml_refcount
+    with _nvml_lock:
+        if _NVML_LIB is None:
+            lib = load_nvml()
+            _NVML_FUNCS = NvmlFunctions(lib)
+            _NVML_LIB = lib
+        if _nvml_refcount == 0:
+            nvml_error(_NVML_LIB, _NVML_LIB.nvmlInit_v2(), "nvmlInit failed")
+        _nvml_refcount += 1
+        return _NVML_LIB
+
+
+def release_nvml():
+    global _nvml_refcount
+    with _nvml_lock:
+        if _nvml_refcount == 0:
+            return
+        _nvml_refcount -= 1
+        if _nvml_refcount == 0:
+            _NVML_LIB.nvmlShutdown()
+
+
 def nvml_error(lib, code, msg):
     if code != NVML_SUCCESS:
         err = lib.nvmlErrorString(code).decode("utf-8", "ignore")
@@ -60,25 +135,28 @@ def ensure_root():
 
 
 def deep_copy_config(cfg: dict) -> dict:
-    return json.loads(json.dumps(cfg))
+    return copy.deepcopy(cfg)
+
+
+def _clone_curve(curve: List[dict]) -> List[dict]:
+    return [{"temperature": p["temperature"], "speed": p["speed"]} for p in curve]
 
 
 def normalize_config(raw_cfg: dict) -> dict:
-    cfg = deep_copy_config(raw_cfg)
-    poll_interval = cfg.get("poll_interval", DEFAULT_CONFIG["poll_interval"])
+    poll_interval = raw_cfg.get("poll_interval", DEFAULT_CONFIG["poll_interval"])
     try:
         poll_interval = float(poll_interval)
     except (TypeError, ValueError):
         poll_interval = DEFAULT_CONFIG["poll_interval"]
 
-    profiles_input = cfg.get("profiles")
+    profiles_input = raw_cfg.get("profiles")
     if not isinstance(profiles_input, list) or not profiles_input:
         profiles_input = [
             {
-                "gpu_index": cfg.get("gpu_index", DEFAULT_PROFILE["gpu_index"]),
-                "fan_index": cfg.get("fan_index", DEFAULT_PROFILE["fan_index"]),
-                "curve": cfg.get("curve", DEFAULT_PROFILE["curve"]),
-                "hysteresis": cfg.get("hysteresis", DEFAULT_PROFILE["hysteresis"]),
+                "gpu_index": raw_cfg.get("gpu_index", DEFAULT_PROFILE["gpu_index"]),
+                "fan_index": raw_cfg.get("fan_index", DEFAULT_PROFILE["fan_index"]),
+                "curve": raw_cfg.get("curve", DEFAULT_PROFILE["curve"]),
+                "hysteresis": raw_cfg.get("hysteresis", DEFAULT_PROFILE["hysteresis"]),
             }
         ]
 
@@ -100,10 +178,10 @@ def normalize_config(raw_cfg: dict) -> dict:
                 continue
             curve.append({"temperature": temp, "speed": max(0.0, min(100.0, speed))})
         if not curve:
-            curve = deep_copy_config(DEFAULT_PROFILE["curve"])
+            curve = _clone_curve(DEFAULT_PROFILE["curve"])
         curve.sort(key=lambda item: item["temperature"])
 
-        hysteresis_raw = entry.get("hysteresis", cfg.get("hysteresis", DEFAULT_PROFILE["hysteresis"]))
+        hysteresis_raw = entry.get("hysteresis", raw_cfg.get("hysteresis", DEFAULT_PROFILE["hysteresis"]))
         try:
             hysteresis = float(hysteresis_raw)
         except (TypeError, ValueError):
@@ -128,20 +206,35 @@ def normalize_config(raw_cfg: dict) -> dict:
 
 
 def load_config(path: str) -> dict:
-    if not os.path.exists(path):
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except FileNotFoundError:
         return deep_copy_config(DEFAULT_CONFIG)
-    with open(path, "r", encoding="utf-8") as fh:
-        cfg = json.load(fh)
+    cfg = _json_fast.loads(data) if _json_fast is not None else json.loads(data)
     return normalize_config(cfg)
 
 
+def serialize_config(config: dict) -> bytes:
+    if _json_fast is not None:
+        return _json_fast.dumps(config, option=_json_fast.OPT_INDENT_2 | _json_fast.OPT_SORT_KEYS) + b"\n"
+    return (json.dumps(config, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
 def save_config(path: str, config: dict) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    config = normalize_config(config)
+    data = serialize_config(normalize_config(config))
+    try:
+        with open(path, "rb") as fh:
+            if fh.read() == data:
+                return
+    except FileNotFoundError:
+        pass
     temp_path = f"{path}.tmp"
-    with open(temp_path, "w", encoding="utf-8") as fh:
-        json.dump(config, fh, indent=2, sort_keys=True)
-        fh.write("\n")
+    with open(temp_path, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
     os.replace(temp_path, path)
 
 
@@ -153,9 +246,9 @@ def parse_curve_string(curve_str: str) -> List[dict]:
         entry = entry.strip()
         if not entry:
             continue
-        if ":" not in entry:
+        temp_str, sep, speed_str = entry.partition(":")
+        if not sep:
             raise ValueError(f"Invalid curve entry '{entry}' (expected temp:speed).")
-        temp_str, speed_str = entry.split(":", 1)
         try:
             temp = float(temp_str)
             speed = float(speed_str)
@@ -168,39 +261,43 @@ def parse_curve_string(curve_str: str) -> List[dict]:
         points.append({"temperature": temp, "speed": speed})
     if not points:
         raise ValueError("Curve must contain at least one point.")
-    points.sort(key=lambda item: item["temperature"])
+    points.sort(key=itemgetter("temperature"))
     return points
 
 
-@dataclass
-class CurvePoint:
-    temperature: float
-    speed: float
-
-
 class FanCurve:
-    def __init__(self, points: List[CurvePoint]):
+    def __init__(self, points: List[Tuple[float, float]]):
         if not points:
             raise ValueError("Fan curve requires at least one point.")
-        self._points = sorted(points, key=lambda p: p.temperature)
+        ordered = sorted(points, key=itemgetter(0))
+        self._temps = array("d", [temp for temp, _ in ordered])
+        self._speeds = array("d", [speed for _, speed in ordered])
+        self._cache_t: Optional[float] = None
+        self._cache_v = 0.0
 
     @classmethod
     def from_dicts(cls, items: List[dict]) -> "FanCurve":
-        pts = []
-        for item in items:
-            pts.append(CurvePoint(float(item["temperature"]), float(item["speed"])))
-        return cls(pts)
+        return cls([(float(item["temperature"]), float(item["speed"])) for item in items])
 
     def to_dicts(self) -> List[dict]:
-        return [{"temperature": p.temperature, "speed": p.speed} for p in self._points]
+        return [{"temperature": temp, "speed": speed} for temp, speed in zip(self._temps, self._speeds)]
 
     def value(self, temperature: float) -> float:
-        chosen = self._points[0].speed
-        for point in self._points:
-            if temperature >= point.temperature:
-                chosen = point.speed
-            else:
-                break
+        if temperature == self._cache_t:
+            return self._cache_v
+        temps = self._temps
+        speeds = self._speeds
+        idx = bisect_right(temps, temperature)
+        if idx == 0:
+            chosen = speeds[0]
+        elif idx >= len(temps):
+            chosen = speeds[-1]
+        else:
+            t0 = temps[idx - 1]
+            s0 = speeds[idx - 1]
+            chosen = s0 + (speeds[idx] - s0) * (temperature - t0) / (temps[idx] - t0)
+        self._cache_t = temperature
+        self._cache_v = chosen
         return chosen
 
 
@@ -220,28 +317,62 @@ def parse_profile_token(token: str) -> Tuple[int, int]:
     return gpu_idx, fan_idx
 
 
-def find_profile(profiles: List[dict], gpu_index: int, fan_index: int) -> Optional[dict]:
+class ProfilesView:
+    def __init__(self, profiles: List[dict]):
+        self.profiles = profiles
+        self._index: Dict[Tuple[int, int], dict] = {}
+        for profile in profiles:
+            self._index.setdefault((profile.get("gpu_index"), profile.get("fan_index")), profile)
+
+    def find(self, gpu_index: int, fan_index: int) -> Optional[dict]:
+        return self._index.get((gpu_index, fan_index))
+
+    def append(self, profile: dict):
+        self.profiles.append(profile)
+        self._index.setdefault((profile.get("gpu_index"), profile.get("fan_index")), profile)
+
+    def remove(self, gpu_index: int, fan_index: int) -> bool:
+        key = (gpu_index, fan_index)
+        profile = self._index.pop(key, None)
+        if profile is None:
+            return False
+        for idx, candidate in enumerate(self.profiles):
+            if candidate is profile:
+                self.profiles.pop(idx)
+                break
+        for candidate in self.profiles:
+            if (candidate.get("gpu_index"), candidate.get("fan_index")) == key:
+                self._index[key] = candidate
+                break
+        return True
+
+
+def find_profile(profiles: Union[List[dict], ProfilesView], gpu_index: int, fan_index: int) -> Optional[dict]:
+    if isinstance(profiles, ProfilesView):
+        return profiles.find(gpu_index, fan_index)
     for profile in profiles:
         if profile.get("gpu_index") == gpu_index and profile.get("fan_index") == fan_index:
             return profile
     return None
 
 
-def ensure_profile(profiles: List[dict], gpu_index: int, fan_index: int, create: bool = False) -> Optional[dict]:
+def ensure_profile(profiles: Union[List[dict], ProfilesView], gpu_index: int, fan_index: int, create: bool = False) -> Optional[dict]:
     profile = find_profile(profiles, gpu_index, fan_index)
     if profile is None and create:
         profile = {
             "gpu_index": gpu_index,
             "fan_index": fan_index,
-            "curve": deep_copy_config(DEFAULT_CURVE),
+            "curve": _clone_curve(DEFAULT_CURVE),
             "hysteresis": DEFAULT_PROFILE["hysteresis"],
         }
         profiles.append(profile)
     return profile
 
 
-def remove_profile(profiles: List[dict], gpu_index: int, fan_index: int) -> bool:
-    for idx, profile in enumerate(list(profiles)):
+def remove_profile(profiles: Union[List[dict], ProfilesView], gpu_index: int, fan_index: int) -> bool:
+    if isinstance(profiles, ProfilesView):
+        return profiles.remove(gpu_index, fan_index)
+    for idx, profile in enumerate(profiles):
         if profile.get("gpu_index") == gpu_index and profile.get("fan_index") == fan_index:
             profiles.pop(idx)
             return True
@@ -264,78 +395,64 @@ class NvmlController:
     def __init__(self, gpu_index: int, fan_index: int):
         self.gpu_index = gpu_index
         self.fan_index = fan_index
-        self.lib = load_nvml()
-        nvml_error(self.lib, self.lib.nvmlInit_v2(), "nvmlInit failed")
-        self.device = self._get_device_handle(gpu_index)
-        self._validate_fan_index(fan_index)
+        self.lib = acquire_nvml()
+        self._active = True
+        funcs = _NVML_FUNCS
+        self._fn_get_handle = funcs.get_handle
+        self._fn_get_temp = funcs.get_temp
+        self._fn_get_speed = funcs.get_fan_speed
+        self._fn_set_speed = funcs.set_fan_speed
+        self._fn_restore_auto = funcs.set_default_fan_speed
+        self._fn_num_fans = funcs.get_num_fans
+        self._temp_out = ctypes.c_uint()
+        self._speed_out = ctypes.c_uint()
+        self._fan_idx_c = ctypes.c_uint(fan_index)
+        try:
+            self.device = self._get_device_handle(gpu_index)
+            self._validate_fan_index(fan_index)
+        except Exception:
+            self.shutdown()
+            raise
 
     def shutdown(self):
-        self.lib.nvmlShutdown()
+        if self._active:
+            self._active = False
+            release_nvml()
 
     def _get_device_handle(self, index: int):
         handle = ctypes.c_void_p()
-        func = self.lib.nvmlDeviceGetHandleByIndex_v2
-        func.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
-        func.restype = ctypes.c_int
-        nvml_error(self.lib, func(index, ctypes.byref(handle)), "nvmlDeviceGetHandleByIndex failed")
+        nvml_error(self.lib, self._fn_get_handle(index, ctypes.byref(handle)), "nvmlDeviceGetHandleByIndex failed")
         return handle
 
     def _validate_fan_index(self, fan_index: int):
-        try:
-            func = self.lib.nvmlDeviceGetNumFans
-        except AttributeError:
+        if self._fn_num_fans is None:
             return
         value = ctypes.c_uint()
-        func.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
-        func.restype = ctypes.c_int
-        nvml_error(self.lib, func(self.device, ctypes.byref(value)), "nvmlDeviceGetNumFans failed")
+        nvml_error(self.lib, self._fn_num_fans(self.device, ctypes.byref(value)), "nvmlDeviceGetNumFans failed")
         if fan_index >= value.value:
             raise NvmlError(f"Fan index {fan_index} out of range (available: {value.value}).")
 
     def get_temperature(self) -> float:
-        func = self.lib.nvmlDeviceGetTemperature
-        func.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
-        func.restype = ctypes.c_int
-        result = ctypes.c_uint()
-        nvml_error(
-            self.lib,
-            func(self.device, 0, ctypes.byref(result)),
-            "nvmlDeviceGetTemperature failed",
-        )
-        return float(result.value)
+        code = self._fn_get_temp(self.device, 0, ctypes.byref(self._temp_out))
+        if code != NVML_SUCCESS:
+            nvml_error(self.lib, code, "nvmlDeviceGetTemperature failed")
+        return float(self._temp_out.value)
 
     def get_fan_speed(self) -> float:
-        func = self.lib.nvmlDeviceGetFanSpeed_v2
-        func.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint)]
-        func.restype = ctypes.c_int
-        value = ctypes.c_uint()
-        nvml_error(
-            self.lib,
-            func(self.device, ctypes.c_uint(self.fan_index), ctypes.byref(value)),
-            "nvmlDeviceGetFanSpeed_v2 failed",
-        )
-        return float(value.value)
-
-    def set_fan_speed(self, speed: float):
-        speed_int = ctypes.c_uint(int(round(speed)))
-        func = self.lib.nvmlDeviceSetFanSpeed_v2
-        func.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint]
-        func.restype = ctypes.c_int
-        nvml_error(
-            self.lib,
-            func(self.device, ctypes.c_uint(self.fan_index), speed_int),
-            "nvmlDeviceSetFanSpeed_v2 failed",
-        )
+        code = self._fn_get_speed(self.device, self._fan_idx_c, ctypes.byref(self._speed_out))
+        if code != NVML_SUCCESS:
+            nvml_error(self.lib, code, "nvmlDeviceGetFanSpeed_v2 failed")
+        return float(self._speed_out.value)
+
+    def set_fan_speed(self, speed: int):
+        code = self._fn_set_speed(self.device, self._fan_idx_c, speed)
+        if code != NVML_SUCCESS:
+            nvml_error(self.lib, code, "nvmlDeviceSetFanSpeed_v2 failed")
 
     def restore_auto(self):
-        func = self.lib.nvmlDeviceSetDefaultFanSpeed_v2
-        func.argtypes = [ctypes.c_void_p, ctypes.c_uint]
-        func.restype = ctypes.c_int
-        nvml_error(
-            self.lib,
-            func(self.device, ctypes.c_uint(self.fan_index)),
-            "nvmlDeviceSetDefaultFanSpeed_v2 failed",
-        )
+        code = self._fn_restore_auto(self.device, self._fan_idx_c)
+        if code != NVML_SUCCESS:
+            nvml_error(self.lib, code, "nvmlDeviceSetDefaultFanSpeed_v2 failed")
 
 
 @dataclass
@@ -347,16 +464,18 @@ class ManagedProfile:
     controller: NvmlController
     last_speed: Optional[float] = None
     last_temp: Optional[float] = None
+    prev_temp: Optional[float] = None
+    hysteresis_eff: float = field(init=False)
+
+    def __post_init__(self):
+        self.hysteresis_eff = max(0.5, self.hysteresis)
 
     def close(self, restore_auto: bool):
         if restore_auto:
             try:
                 self.controller.restore_auto()
             except NvmlError as exc:
-                print(
-                    f"[fan-manager] Failed to restore automatic mode for GPU {self.gpu_index} fan {self.fan_index}: {exc}",
-                    file=sys.stderr,
-                )
+                log.error("Failed to restore automatic mode for GPU %d fan %d: %s", self.gpu_index, self.fan_index, exc)
         self.controller.shutdown()
 
 
@@ -367,11 +486,17 @@ class FanManager:
         poll_interval: float,
         restore_on_exit: bool,
         config_path: str,
+        config: Optional[dict] = None,
+        idle_backoff: bool = True,
     ):
         self.profiles = profiles
         self.poll_interval = max(0.5, float(poll_interval))
         self.restore_on_exit = restore_on_exit
+        self.idle_backoff = idle_backoff
+        self._idle_ticks = 0
         self.config_path = config_path
+        self._config = config
+        self._config_fingerprint = self._stat_config() if config is not None else None
         self._running = True
         self._reload_requested = False
         signal.signal(signal.SIGTERM, self.stop)
@@ -397,71 +522,146 @@ class FanManager:
     def should_apply(profile: ManagedProfile, target_speed: float) -> bool:
         if profile.last_speed is None:
             return True
-        threshold = max(0.5, profile.hysteresis)
-        return abs(target_speed - profile.last_speed) >= threshold
+        return abs(target_speed - profile.last_speed) >= profile.hysteresis_eff
 
     @staticmethod
-    def apply_speed(profile: ManagedProfile, target_speed: float, temperature: float):
+    def apply_speed(profile: ManagedProfile, target_speed: float, temperature: float) -> bool:
         target_speed = max(10.0, min(100.0, target_speed))
-        profile.controller.set_fan_speed(target_speed)
+        speed_int = int(round(target_speed))
+        written = profile.last_speed is None or int(round(profile.last_speed)) != speed_int
+        if written:
+            profile.controller.set_fan_speed(speed_int)
         profile.last_speed = target_speed
         profile.last_temp = temperature
+        return written
+
+    def _update_profile(self, profile: ManagedProfile, temperature: float, target: float) -> bool:
+        steady = profile.prev_temp is not None and abs(temperature - profile.prev_temp) <= IDLE_TEMP_DELTA
+        profile.prev_temp = temperature
+        if not self.should_apply(profile, target):
+            log.debug(
+                "GPU %d fan %d temp=%.1f°C target=%.1f%% (within hysteresis)",
+                profile.gpu_index,
+                profile.fan_index,
+                temperature,
+                target,
+            )
+            return not steady
+        if self.apply_speed(profile, target, temperature):
+            log.info(
+                "GPU %d fan %d temp=%.1f°C target=%.1f%% applied",
+                profile.gpu_index,
+                profile.fan_index,
+                temperature,
+                target,
+            )
+        else:
+            log.debug(
+                "GPU %d fan %d temp=%.1f°C target=%.1f%% (duty cycle unchanged)",
+                profile.gpu_index,
+                profile.fan_index,
+                temperature,
+                target,
+            )
+        return True
+
+    @staticmethod
+    def _report_error(profile: ManagedProfile, exc: Exception):
+        log.error("Error managing GPU %d fan %d: %s", profile.gpu_index, profile.fan_index, exc)
 
     def loop_once(self):
         if not self.profiles:
-            print("[fan-manager] No profiles configured; sleeping.", flush=True)
+            log.info("No profiles configured; sleeping.")
             time.sleep(self.poll_interval)
             return
 
+        active = False
         for profile in self.profiles:
             try:
                 temperature = profile.controller.get_temperature()
-                target = profile.curve.value(temperature)
-                if self.should_apply(profile, target):
-                    self.apply_speed(profile, target, temperature)
-                    print(
-                        f"[fan-manager] GPU {profile.gpu_index} fan {profile.fan_index} temp={temperature:.1f}°C target={target:.1f}% applied",
-                        flush=True,
-                    )
-                else:
-                    print(
-                        f"[fan-manager] GPU {profile.gpu_index} fan {profile.fan_index} temp={temperature:.1f}°C target={target:.1f}% (within hysteresis)",
-                        flush=True,
-                    )
+                active |= self._update_profile(profile, temperature, profile.curve.value(temperature))
             except NvmlError as exc:
-                print(
-                    f"[fan-manager] Error managing GPU {profile.gpu_index} fan {profile.fan_index}: {exc}",
-                    file=sys.stderr,
-                    flush=True,
-                )
+                self._report_error(profile, exc)
+                active = True
+        self._idle_ticks = 0 if active else self._idle_ticks + 1
+
+    def effective_interval(self) -> float:
+        if not self.idle_backoff or self._idle_ticks == 0:
+            return self.poll_interval
+        backoff = self.poll_interval * (2 ** min(self._idle_ticks, IDLE_BACKOFF_STEPS))
+        return max(self.poll_interval, min(backoff, IDLE_MAX_INTERVAL))
+
+    @staticmethod
+    def _sleep(wake_fd: int, delay: float):
+        ready, _, _ = select.select([wake_fd], [], [], delay)
+        if ready:
+            try:
+                while os.read(wake_fd, 512):
+                    pass
+            except BlockingIOError:
+                pass
 
     def run(self):
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        previous_wakeup_fd = signal.set_wakeup_fd(wake_w)
         try:
+            deadline = time.monotonic()
             while self._running:
                 if self._reload_requested:
                     self.reload_config()
                     self._reload_requested = False
+                    self._idle_ticks = 0
                 self.loop_once()
-                time.sleep(self.poll_interval)
+                deadline += self.effective_interval()
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    if self._running and not self._reload_requested:
+                        self._sleep(wake_r, delay)
+                else:
+                    deadline = time.monotonic()
         finally:
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            os.close(wake_r)
+            os.close(wake_w)
             self._close_profiles(self.profiles, restore=self.restore_on_exit)
 
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def reload_config(self):
+        fingerprint = self._stat_config()
+        if fingerprint is not None and fingerprint == self._config_fingerprint:
+            log.info("Configuration unchanged; skipping reload.")
+            return
         try:
             cfg = load_config(self.config_path)
         except Exception as exc:
-            print(f"[fan-manager] Failed to reload config: {exc}", file=sys.stderr)
+            log.error("Failed to reload config: %s", exc)
+            return
+        if self._config is not None and cfg.get("profiles") == self._config.get("profiles"):
+            self.poll_interval = max(0.5, float(cfg.get("poll_interval", self.poll_interval)))
+            self._config = cfg
+            self._config_fingerprint = fingerprint
+            log.info("Configuration reloaded (profiles unchanged).")
             return
         try:
             new_profiles = build_managed_profiles(cfg)
         except Exception as exc:
-            print(f"[fan-manager] Invalid configuration: {exc}", file=sys.stderr)
+            log.error("Invalid configuration: %s", exc)
             for profile in new_profiles if 'new_profiles' in locals() else []:
                 profile.close(restore_auto=False)
             return
         self.poll_interval = max(0.5, float(cfg.get("poll_interval", self.poll_interval)))
         self.set_profiles(new_profiles)
-        print("[fan-manager] Configuration reloaded.", flush=True)
+        self._config = cfg
+        self._config_fingerprint = fingerprint
+        log.info("Configuration reloaded.")
 
 
 def build_managed_profiles(cfg: dict) -> List[ManagedProfile]:
@@ -503,28 +703,35 @@ def command_status(config: dict, profile_selector: Optional[Tuple[int, int]] = N
     else:
         selected = profiles_cfg
 
+    try:
+        acquire_nvml()
+    except NvmlError as exc:
+        raise SystemExit(f"Failed to initialize NVML: {exc}") from exc
     entries = []
-    for entry in selected:
-        try:
-            controller = NvmlController(entry["gpu_index"], entry["fan_index"])
-        except NvmlError as exc:
-            raise SystemExit(f"Failed to query GPU {entry['gpu_index']} fan {entry['fan_index']}: {exc}") from exc
-        try:
-            temp = controller.get_temperature()
-            speed = controller.get_fan_speed()
-            target = FanCurve.from_dicts(entry["curve"]).value(temp)
-        finally:
-            controller.shutdown()
-        entries.append(
-            {
-                "gpu_index": entry["gpu_index"],
-                "fan_index": entry["fan_index"],
-                "temperature": temp,
-                "current_speed": speed,
-                "target_speed": target,
-                "hysteresis": float(entry.get("hysteresis", DEFAULT_PROFILE["hysteresis"])),
-            }
-        )
+    try:
+        for entry in selected:
+            curve = FanCurve.from_dicts(entry["curve"])
+            try:
+                controller = NvmlController(entry["gpu_index"], entry["fan_index"])
+            except NvmlError as exc:
+                raise SystemExit(f"Failed to query GPU {entry['gpu_index']} fan {entry['fan_index']}: {exc}") from exc
+            try:
+                temp = controller.get_temperature()
+                speed = controller.get_fan_speed()
+            finally:
+                controller.shutdown()
+            entries.append(
+                {
+                    "gpu_index": entry["gpu_index"],
+                    "fan_index": entry["fan_index"],
+                    "temperature": temp,
+                    "current_speed": speed,
+                    "target_speed": curve.value(temp),
+                    "hysteresis": float(entry.get("hysteresis", DEFAULT_PROFILE["hysteresis"])),
+                }
+            )
+    finally:
+        release_nvml()
 
     print(json.dumps({"poll_interval": poll_interval, "profiles": entries}, indent=2))
 
@@ -543,17 +750,36 @@ def restore_auto_profiles(config: dict, profile_selector: Optional[Tuple[int, in
         print("No profiles configured.")
         return
 
-    for entry in targets:
-        controller = NvmlController(entry["gpu_index"], entry["fan_index"])
-        try:
-            controller.restore_auto()
-            print(f"Automatic fan control restored for GPU {entry['gpu_index']} fan {entry['fan_index']}.")
-        finally:
-            controller.shutdown()
+    acquire_nvml()
+    try:
+        for entry in targets:
+            controller = NvmlController(entry["gpu_index"], entry["fan_index"])
+            try:
+                controller.restore_auto()
+                print(f"Automatic fan control restored for GPU {entry['gpu_index']} fan {entry['fan_index']}.")
+            finally:
+                controller.shutdown()
+    finally:
+        release_nvml()
+
+
+def configure_logging(verbose: bool = False):
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in (stdout_handler, stderr_handler):
+        handler.setFormatter(formatter)
+        log.addHandler(handler)
+    log.setLevel(logging.DEBUG if verbose else logging.INFO)
+    log.propagate = False
 
 
 def ensure_config_defaults(path: str):
-    if not os.path.exists(path):
+    try:
+        os.stat(path)
+    except FileNotFoundError:
         save_config(path, deep_copy_config(DEFAULT_CONFIG))
 
 
@@ -574,24 +800,28 @@ def main():
     parser.add_argument("--set-poll-interval", type=float, help="Update poll interval in seconds.")
     parser.add_argument("--set-hysteresis", type=float, help="Update hysteresis in °C.")
     parser.add_argument("--no-restore-on-exit", action="store_true", help="Do not restore auto mode when exiting daemon.")
+    parser.add_argument("--no-idle-backoff", action="store_true", help="Poll at the configured interval even while temperatures are steady.")
+    parser.add_argument("--verbose", action="store_true", help="Log every poll, including readings within hysteresis.")
     args = parser.parse_args()
+    configure_logging(args.verbose)
 
     ensure_root()
     ensure_config_defaults(args.config)
 
     config = load_config(args.config)
+    profiles_view = ProfilesView(config["profiles"])
     config_changed = False
 
     if args.add_profile:
         gpu, fan = parse_profile_token(args.add_profile)
-        ensure_profile(config["profiles"], gpu, fan, create=True)
+        ensure_profile(profiles_view, gpu, fan, create=True)
         config_changed = True
         if not args.profile:
             args.profile = args.add_profile
 
     if args.remove_profile:
         gpu, fan = parse_profile_token(args.remove_profile)
-        if remove_profile(config["profiles"], gpu, fan):
+        if remove_profile(profiles_view, gpu, fan):
             config_changed = True
         else:
             print(f"Profile {gpu}:{fan} not found.", file=sys.stderr)
@@ -599,7 +829,7 @@ def main():
     target_profile = None
     if args.set_curve or args.set_hysteresis is not None:
         gpu, fan = resolve_profile_tuple(args, config)
-        target_profile = ensure_profile(config["profiles"], gpu, fan, create=True)
+        target_profile = ensure_profile(profiles_view, gpu, fan, create=True)
 
     if args.set_curve:
         target_profile["curve"] = parse_curve_string(args.set_curve)
@@ -608,7 +838,7 @@ def main():
     if args.set_hysteresis is not None:
         hysteresis = max(0.0, float(args.set_hysteresis))
         target_profile = target_profile or ensure_profile(
-            config["profiles"],
+            profiles_view,
             *resolve_profile_tuple(args, config),
             create=True,
         )
@@ -653,6 +883,8 @@ def main():
             poll_interval=config.get("poll_interval", DEFAULT_CONFIG["poll_interval"]),
             restore_on_exit=not args.no_restore_on_exit,
             config_path=args.config,
+            config=config,
+            idle_backoff=not args.no_idle_backoff,
         )
 
         if args.once:
@@ -1,26 +1,98 @@
 #!/usr/bin/env python3
-import copy
+import atexit
+import collections
 import ctypes
 import ctypes.util
-import json
+import functools
+import operator
 import os
 import shutil
 import subprocess
 import sys
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from nvidia_fan_manager import DEFAULT_CONFIG as CORE_DEFAULT_CONFIG, normalize_config
+from nvidia_fan_manager import (
+    DEFAULT_CONFIG as CORE_DEFAULT_CONFIG,
+    ProfilesView,
+    ensure_profile,
+    load_config as core_load_config,
+    normalize_config,
+    save_config as core_save_config,
+    serialize_config,
+)
 
 CONFIG_PATH = "/etc/nvidia-fan-manager/config.json"
-MANAGER_BINARY = "/usr/local/bin/nvidia_fan_manager.py"
 SERVICE_NAME = "nvidia-fan-manager.service"
 
-DEFAULT_CURVE = copy.deepcopy(CORE_DEFAULT_CONFIG["profiles"][0]["curve"])
+# Run as root through pkexec: stage the new config next to the target, skip
+# the swap when nothing changed, otherwise flush it and rename it into place.
+_PRIVILEGED_SAVE_SCRIPT = """set -e
+target="$1"
+mkdir -p "$(dirname "$target")"
+tmp="$(mktemp "$target.XXXXXX")"
+trap 'rm -f "$tmp"' EXIT
+cat > "$tmp"
+if cmp -s "$tmp" "$target"; then
+    exit 0
+fi
+chmod 644 "$tmp"
+sync "$tmp"
+mv -f "$tmp" "$target"
+"""
+
+CurvePoint = collections.namedtuple("CurvePoint", ("temperature", "speed"))
+
+_DEFAULT_CURVE_TPL = tuple(
+    CurvePoint(float(p["temperature"]), float(p["speed"])) for p in CORE_DEFAULT_CONFIG["profiles"][0]["curve"]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str):
+    return shutil.which(name)
+
+
+_temp_key = operator.attrgetter("temperature")
 
 
 def default_curve():
-    return copy.deepcopy(DEFAULT_CURVE)
+    return list(_DEFAULT_CURVE_TPL)
+
+
+def _config_from_json(cfg: dict) -> dict:
+    return {
+        "poll_interval": cfg["poll_interval"],
+        "profiles": [
+            {
+                "gpu_index": profile["gpu_index"],
+                "fan_index": profile["fan_index"],
+                "curve": [CurvePoint(float(p["temperature"]), float(p["speed"])) for p in profile["curve"]],
+                "hysteresis": profile["hysteresis"],
+            }
+            for profile in cfg["profiles"]
+        ],
+    }
+
+
+def _config_to_json(cfg: dict) -> dict:
+    return {
+        "poll_interval": cfg["poll_interval"],
+        "profiles": [
+            {
+                "gpu_index": profile["gpu_index"],
+                "fan_index": profile["fan_index"],
+                "curve": [{"temperature": p.temperature, "speed": p.speed} for p in profile["curve"]],
+                "hysteresis": profile["hysteresis"],
+            }
+            for profile in cfg["profiles"]
+        ],
+    }
+
+
+def _clone_default_config() -> dict:
+    return _config_from_json(CORE_DEFAULT_CONFIG)
 
 
 NVML_SUCCESS = 0
@@ -38,6 +110,14 @@ def _load_nvml_library():
     lib.nvmlDeviceGetCount_v2.argtypes = [ctypes.POINTER(ctypes.c_uint)]
     lib.nvmlDeviceGetHandleByIndex_v2.restype = ctypes.c_int
     lib.nvmlDeviceGetHandleByIndex_v2.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+    lib._has_get_name = getattr(lib, "nvmlDeviceGetName", None) is not None
+    lib._has_get_num_fans = getattr(lib, "nvmlDeviceGetNumFans", None) is not None
+    if lib._has_get_name:
+        lib.nvmlDeviceGetName.restype = ctypes.c_int
+        lib.nvmlDeviceGetName.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint]
+    if lib._has_get_num_fans:
+        lib.nvmlDeviceGetNumFans.restype = ctypes.c_int
+        lib.nvmlDeviceGetNumFans.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
     return lib
 
 
@@ -47,61 +127,82 @@ def _nvml_check(lib, result, msg):
         raise RuntimeError(f"{msg}: {err}")
 
 
-def discover_gpus_and_fans():
-    lib = _load_nvml_library()
-    gpus = []
-    try:
-        _nvml_check(lib, lib.nvmlInit_v2(), "nvmlInit")
-        count = ctypes.c_uint()
-        _nvml_check(lib, lib.nvmlDeviceGetCount_v2(ctypes.byref(count)), "nvmlDeviceGetCount_v2")
-        for idx in range(count.value):
-            handle = ctypes.c_void_p()
-            _nvml_check(
-                lib,
-                lib.nvmlDeviceGetHandleByIndex_v2(ctypes.c_uint(idx), ctypes.byref(handle)),
-                f"nvmlDeviceGetHandleByIndex_v2({idx})",
-            )
+_NVML_LIB = None
+_nvml_lock = threading.Lock()
 
-            name = f"GPU {idx}"
-            try:
-                lib.nvmlDeviceGetName.restype = ctypes.c_int
-                lib.nvmlDeviceGetName.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint]
-                buf = ctypes.create_string_buffer(256)
-                res = lib.nvmlDeviceGetName(handle, buf, ctypes.c_uint(len(buf)))
-                if res == NVML_SUCCESS:
-                    decoded = buf.value.decode("utf-8", "ignore")
-                    if decoded:
-                        name = decoded
-            except AttributeError:
-                pass
-
-            fans = 1
-            try:
-                lib.nvmlDeviceGetNumFans.restype = ctypes.c_int
-                lib.nvmlDeviceGetNumFans.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
-                fan_count = ctypes.c_uint()
-                res = lib.nvmlDeviceGetNumFans(handle, ctypes.byref(fan_count))
-                if res == NVML_SUCCESS and fan_count.value > 0:
-                    fans = fan_count.value
-            except AttributeError:
-                pass
-
-            gpus.append({"index": idx, "name": name, "fans": max(1, fans)})
-    finally:
+
+def _get_nvml():
+    global _NVML_LIB
+    with _nvml_lock:
+        if _NVML_LIB is None:
+            lib = _load_nvml_library()
+            _nvml_check(lib, lib.nvmlInit_v2(), "nvmlInit")
+            _NVML_LIB = lib
+            atexit.register(_shutdown_nvml)
+        return _NVML_LIB
+
+
+def _shutdown_nvml():
+    global _NVML_LIB
+    with _nvml_lock:
+        if _NVML_LIB is None:
+            return
         try:
-            lib.nvmlShutdown()
+            _NVML_LIB.nvmlShutdown()
         except Exception:
             pass
+        _NVML_LIB = None
+
+
+def discover_gpus_and_fans():
+    lib = _get_nvml()
+    gpus = []
+    count = ctypes.c_uint()
+    _nvml_check(lib, lib.nvmlDeviceGetCount_v2(ctypes.byref(count)), "nvmlDeviceGetCount_v2")
+    for idx in range(count.value):
+        handle = ctypes.c_void_p()
+        _nvml_check(
+            lib,
+            lib.nvmlDeviceGetHandleByIndex_v2(ctypes.c_uint(idx), ctypes.byref(handle)),
+            f"nvmlDeviceGetHandleByIndex_v2({idx})",
+        )
+
+        name = f"GPU {idx}"
+        if lib._has_get_name:
+            buf = ctypes.create_string_buffer(256)
+            res = lib.nvmlDeviceGetName(handle, buf, ctypes.c_uint(len(buf)))
+            if res == NVML_SUCCESS:
+                decoded = buf.value.decode("utf-8", "ignore")
+                if decoded:
+                    name = decoded
+
+        fans = 1
+        if lib._has_get_num_fans:
+            fan_count = ctypes.c_uint()
+            res = lib.nvmlDeviceGetNumFans(handle, ctypes.byref(fan_count))
+            if res == NVML_SUCCESS and fan_count.value > 0:
+                fans = fan_count.value
+
+        gpus.append({"index": idx, "name": name, "fans": max(1, fans)})
     return gpus
 
 
 
+_CONFIG_CACHE = {}
+
+
 def load_config() -> dict:
-    if not os.path.exists(CONFIG_PATH):
-        return copy.deepcopy(CORE_DEFAULT_CONFIG)
-    with open(CONFIG_PATH, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    return normalize_config(data)
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        return _clone_default_config()
+    key = (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = core_load_config(CONFIG_PATH)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = cached
+    return _config_from_json(cached)
 
 
 class FanCurveManagerGUI:
@@ -109,10 +210,13 @@ class FanCurveManagerGUI:
         self.root = root
         self.root.title("Nvidia Fancurve Manager")
         self.config = load_config()
+        self._index_profiles()
         self._loading = False
         self.gpu_options = self._discover_hardware()
         if not self.gpu_options:
             self.gpu_options = [{"index": 0, "name": "GPU 0", "fans": 1}]
+        self._gpu_labels = [f"{info['index']}: {info['name']}" for info in self.gpu_options]
+        self._gpu_index_to_pos = {info["index"]: pos for pos, info in enumerate(self.gpu_options)}
         first_profile = self.config.get("profiles", [])[0]
         self.current_gpu_index = int(first_profile.get("gpu_index", self.gpu_options[0]["index"]))
         self.current_fan_index = int(first_profile.get("fan_index", 0))
@@ -202,17 +306,16 @@ class FanCurveManagerGUI:
         return [{"index": 0, "name": "GPU 0", "fans": 1}]
 
     def _refresh_gpu_combo(self):
-        values = [f"{info['index']}: {info['name']}" for info in self.gpu_options]
-        self.gpu_combo["values"] = values or ["GPU 0"]
+        self.gpu_combo["values"] = self._gpu_labels or ["GPU 0"]
 
     def _profiles(self):
         return self.config.setdefault("profiles", [])
 
+    def _index_profiles(self):
+        self._profile_index = ProfilesView(self._profiles())
+
     def _find_profile(self, gpu_index: int, fan_index: int):
-        for profile in self._profiles():
-            if profile.get("gpu_index") == gpu_index and profile.get("fan_index") == fan_index:
-                return profile
-        return None
+        return self._profile_index.find(gpu_index, fan_index)
 
     def _default_hysteresis(self) -> float:
         profiles = self._profiles()
@@ -229,14 +332,16 @@ class FanCurveManagerGUI:
                 "curve": default_curve(),
                 "hysteresis": self._default_hysteresis(),
             }
-            self._profiles().append(profile)
+            self._profile_index.append(profile)
         return profile
 
     def _set_tree_curve(self, curve):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for point in sorted(curve, key=lambda p: p["temperature"]):
-            self.tree.insert("", tk.END, values=(f"{point['temperature']:.1f}", f"{point['speed']:.1f}"))
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        rows = [(f"{p.temperature:.1f}", f"{p.speed:.1f}") for p in sorted(curve, key=_temp_key)]
+        for values in rows:
+            self.tree.insert("", tk.END, values=values)
 
     def _load_profile_curve(self, gpu_index: int, fan_index: int):
         profile = self._find_profile(gpu_index, fan_index)
@@ -248,11 +353,7 @@ class FanCurveManagerGUI:
         self._update_poll_info()
 
     def _set_gpu_selection(self, gpu_index: int):
-        match = 0
-        for pos, info in enumerate(self.gpu_options):
-            if info["index"] == gpu_index:
-                match = pos
-                break
+        match = self._gpu_index_to_pos.get(gpu_index, 0)
         self._loading = True
         self.gpu_combo.current(match)
         self._loading = False
@@ -308,17 +409,21 @@ class FanCurveManagerGUI:
 
     def _populate_fields(self):
         self._loading = True
-        self._refresh_gpu_combo()
-        profiles = self._profiles()
-        first_profile = profiles[0]
-        self._set_gpu_selection(int(first_profile.get("gpu_index", self.gpu_options[0]["index"])))
-        self._update_fan_options(int(first_profile.get("fan_index", 0)))
-        self._loading = False
-        self._load_profile_curve(self.current_gpu_index, self.current_fan_index)
+        try:
+            self._refresh_gpu_combo()
+            profiles = self._profiles()
+            first_profile = profiles[0]
+            self._set_gpu_selection(int(first_profile.get("gpu_index", self.gpu_options[0]["index"])))
+            self._update_fan_options(int(first_profile.get("fan_index", 0)))
+            self._loading = False
+            self._load_profile_curve(self.current_gpu_index, self.current_fan_index)
+        finally:
+            self._loading = False
 
     def reload_config(self):
         try:
             self.config = load_config()
+            self._index_profiles()
             first_profile = self.config["profiles"][0]
             self.current_gpu_index = int(first_profile.get("gpu_index", self.gpu_options[0]["index"]))
             self.current_fan_index = int(first_profile.get("fan_index", 0))
@@ -358,24 +463,17 @@ class FanCurveManagerGUI:
         self.tree.delete(selection[0])
 
     def _collect_curve(self):
-        items = []
-        for item in self.tree.get_children():
-            temp_str, speed_str = self.tree.item(item, "values")
-            items.append(
-                {
-                    "temperature": float(temp_str),
-                    "speed": float(speed_str),
-                }
-            )
-        if not items:
+        rows = [self.tree.item(item, "values") for item in self.tree.get_children()]
+        if not rows:
             raise ValueError("Curve must contain at least one point.")
-        items.sort(key=lambda entry: entry["temperature"])
+        points = [CurvePoint(float(temp_str), float(speed_str)) for temp_str, speed_str in rows]
+        points.sort(key=_temp_key)
         last_temp = -1
-        for entry in items:
-            if entry["temperature"] <= last_temp:
+        for point in points:
+            if point.temperature <= last_temp:
                 raise ValueError("Temperatures must be strictly increasing.")
-            last_temp = entry["temperature"]
-        return items
+            last_temp = point.temperature
+        return points
 
     def save_config(self):
         try:
@@ -398,44 +496,59 @@ class FanCurveManagerGUI:
         gpu_index = int(self.current_gpu_index)
         fan_index = int(self.current_fan_index)
 
-        curve_str = ",".join(f"{pt['temperature']:.1f}:{pt['speed']:.1f}" for pt in curve)
-        cmd = [
-            "python3",
-            MANAGER_BINARY,
-            "--config",
-            CONFIG_PATH,
-            "--profile",
-            f"{gpu_index}:{fan_index}",
-            "--set-curve",
-            curve_str,
-            "--set-hysteresis",
-            str(hysteresis),
-            "--set-poll-interval",
-            str(poll_interval),
-        ]
-
-        cmd = self._wrap_with_pkexec(cmd)
-        if cmd is None:
-            return
-
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"Manager binary not found at {MANAGER_BINARY}")
+            pending = load_config()
+        except Exception as exc:
+            messagebox.showerror("Error saving", f"Failed to read configuration:\n{exc}")
             return
-        except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr.strip() if exc.stderr else str(exc)
-            messagebox.showerror("Error saving", f"Failed to update configuration:\n{stderr}")
+        target = ensure_profile(pending["profiles"], gpu_index, fan_index, create=True)
+        target["curve"] = list(curve)
+        target["hysteresis"] = hysteresis
+        pending["poll_interval"] = poll_interval
+        if not self._write_config(pending):
             return
 
-        profile["curve"] = [item.copy() for item in curve]
+        profile["curve"] = list(curve)
         profile["hysteresis"] = hysteresis
         self.config["poll_interval"] = poll_interval
         self._load_profile_curve(gpu_index, fan_index)
         messagebox.showinfo("Saved", "Configuration saved. Use 'Apply' to notify the running daemon.")
 
+    def _write_config(self, config: dict) -> bool:
+        config = _config_to_json(config)
+        if os.geteuid() == 0:
+            try:
+                core_save_config(CONFIG_PATH, config)
+            except OSError as exc:
+                messagebox.showerror("Error saving", f"Failed to update configuration:\n{exc}")
+                return False
+            return True
+
+        payload = serialize_config(normalize_config(config))
+        try:
+            with open(CONFIG_PATH, "rb") as fh:
+                if fh.read() == payload:
+                    return True
+        except OSError:
+            pass
+
+        cmd = self._wrap_with_pkexec(["sh", "-c", _PRIVILEGED_SAVE_SCRIPT, "sh", CONFIG_PATH])
+        if cmd is None:
+            return False
+
+        try:
+            subprocess.run(cmd, input=payload, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except FileNotFoundError as exc:
+            messagebox.showerror("Error saving", f"Failed to update configuration:\n{exc}")
+            return False
+        except subprocess.CalledProcessError as exc:
+            stderr = exc.stderr.decode("utf-8", "ignore").strip() if exc.stderr else str(exc)
+            messagebox.showerror("Error saving", f"Failed to update configuration:\n{stderr}")
+            return False
+        return True
+
     def reload_service(self):
-        if not shutil.which("systemctl"):
+        if not _which("systemctl"):
             messagebox.showinfo("systemctl not found", "systemctl is not available; restart the daemon manually.")
             return
         cmd = ["systemctl", "reload", SERVICE_NAME]
@@ -454,7 +567,7 @@ class FanCurveManagerGUI:
         if os.geteuid() == 0:
             return cmd
 
-        pkexec_path = shutil.which("pkexec")
+        pkexec_path = _which("pkexec")
         if not pkexec_path:
             messagebox.showerror(
                 "Permission required",